@@ -1,6 +1,8 @@
 
 
 class Transient:
+    __slots__ = ('trigger_time', 'temporal_index', 'spectral_index', 'ebv')
+
     def __init__(self, trigger_time: float, a: float, b: float, ebv: float):
         """
         :param trigger_time:
@@ -8,13 +8,27 @@ import os
 
 
 def read(path: str) -> list:
-    """ Reads the file at specified path and returns its contents.
+    """ Reads the file at specified path and returns its contents. The
+    file is read in a single call and split afterwards, keeping the line
+    endings so the lines can be written back unchanged.
 
     :param path: path to file.
     :return: list of strings containing file data
     """
     with open(path) as f:
-        return f.readlines()
+        return f.read().splitlines(keepends=True)
+
+
+def read_bytes(path: str) -> list:
+    """ Reads the file at specified path as raw bytes and returns its
+    lines without line endings. Avoids decoding files whose contents are
+    only scanned for markers or handed to a numeric parser.
+
+    :param path: path to file.
+    :return: list of bytes containing file data
+    """
+    with open(path, 'rb') as f:
+        return f.read().splitlines()
 
 
 def write(path: str, lines: list, clobber: bool = True) -> None:
@@ -29,5 +43,4 @@ def write(path: str, lines: list, clobber: bool = True) -> None:
         raise IOError(f"File {path} already exists.")
 
     with open(path, 'w') as f:
-        for line in lines:
-            f.write(line)
+        f.writelines(lines)
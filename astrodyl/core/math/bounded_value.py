@@ -1,6 +1,8 @@
-import numpy as np
+import math
 import operator
 
+import numpy as np
+
 
 class BoundedValue:
     def __init__(self, value: float = None, lower: float = None, upper: float = None):
@@ -51,7 +53,109 @@ class BoundedValue:
         else:
             return NotImplemented
 
-        result.lower = result.value * float(np.sqrt((self.lower / self.value) ** 2 + (other.lower / other.value) ** 2))
-        result.upper = result.value * float(np.sqrt((self.upper / self.value) ** 2 + (other.upper / other.value) ** 2))
+        inv_self, inv_other = 1.0 / self.value, 1.0 / other.value
+
+        result.lower = result.value * math.hypot(self.lower * inv_self, other.lower * inv_other)
+        result.upper = result.value * math.hypot(self.upper * inv_self, other.upper * inv_other)
 
         return result
+
+
+class BoundedArray:
+    def __init__(self, values: np.ndarray, lowers: np.ndarray, uppers: np.ndarray):
+        """ Array of bounded values stored as parallel value, lower and upper
+        arrays. Vectorized counterpart of BoundedValue for catalog-sized
+        inputs.
+
+        :param values: values
+        :param lowers: lower bounds
+        :param uppers: upper bounds
+        """
+        self.value = np.asarray(values, dtype=np.float64)
+        self.lower = np.asarray(lowers, dtype=np.float64)
+        self.upper = np.asarray(uppers, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index: int) -> BoundedValue:
+        """ Returns the bounded value at the provided index.
+
+        :param index: element index
+        :return: BoundedValue
+        """
+        return BoundedValue(float(self.value[index]), float(self.lower[index]), float(self.upper[index]))
+
+    def __truediv__(self, other):
+        """ Returns a BoundedArray with the values equal to the element-wise
+        division of the two arrays. The new bounds are calculated using
+        quadrature.
+
+        :param other: BoundedArray
+        :return: Resultant BoundedArray
+        """
+        return self.perform_operation(other, np.divide)
+
+    def __mul__(self, other):
+        """ Returns a BoundedArray with the values equal to the element-wise
+        multiplication of the two arrays. The new bounds are calculated using
+        quadrature. This method ignores any correlation between two values.
+
+        :param other: BoundedArray
+        :return: Resultant BoundedArray
+        """
+        return self.perform_operation(other, np.multiply)
+
+    def perform_operation(self, other, operation):
+        """ Performs the operation on the BoundedArrays. Performs error
+        propagation assuming that the values are not correlated. The
+        intermediate results are written into preallocated buffers.
+
+        Supported operations:
+            - multiplication
+            - division
+
+        :param other: BoundedArray
+        :param operation: np.multiply or np.divide
+        :return: Resultant BoundedArray
+        """
+        if not isinstance(other, BoundedArray):
+            return NotImplemented
+
+        if operation is not np.divide and operation is not np.multiply:
+            return NotImplemented
+
+        shape = np.broadcast_shapes(self.value.shape, other.value.shape)
+        values, lowers, uppers = np.empty(shape), np.empty(shape), np.empty(shape)
+        inv_self, inv_other = np.empty(self.value.shape), np.empty(other.value.shape)
+
+        operation(self.value, other.value, out=values)
+        np.reciprocal(self.value, out=inv_self)
+        np.reciprocal(other.value, out=inv_other)
+
+        # Relative errors are accumulated in the output buffers, then scaled
+        np.hypot(self.lower * inv_self, other.lower * inv_other, out=lowers)
+        np.hypot(self.upper * inv_self, other.upper * inv_other, out=uppers)
+        np.multiply(lowers, values, out=lowers)
+        np.multiply(uppers, values, out=uppers)
+
+        result = BoundedArray.__new__(BoundedArray)
+        result.value, result.lower, result.upper = values, lowers, uppers
+        return result
+
+
+def bulk_divide(a_values: np.ndarray, a_lowers: np.ndarray, a_uppers: np.ndarray,
+                b_values: np.ndarray, b_lowers: np.ndarray, b_uppers: np.ndarray) -> tuple:
+    """ Divides arrays of bounded values element-wise. Vectorized
+    equivalent of `BoundedValue.__truediv__` for catalog-sized inputs.
+
+    :param a_values: numerator values
+    :param a_lowers: numerator lower bounds
+    :param a_uppers: numerator upper bounds
+    :param b_values: denominator values
+    :param b_lowers: denominator lower bounds
+    :param b_uppers: denominator upper bounds
+    :return: tuple of (values, lowers, uppers) arrays
+    """
+    result = BoundedArray(a_values, a_lowers, a_uppers) / BoundedArray(b_values, b_lowers, b_uppers)
+    return result.value, result.lower, result.upper
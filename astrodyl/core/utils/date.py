@@ -1,21 +1,48 @@
+import functools
 from datetime import datetime, timedelta
 
+import numpy as np
+
 
 class Date:
-    def __init__(self, mjd: float = None, utc: str | datetime = None):
-        self.epoch = datetime(1858, 11, 17)
+    __slots__ = ('mjd', 'utc')
+
+    EPOCH = datetime(1858, 11, 17)
 
+    def __init__(self, mjd: float = None, utc: str | datetime = None):
         if mjd:
             self.mjd = mjd
-            self.utc = self.epoch + timedelta(days=self.mjd)
+            self.utc = self.EPOCH + timedelta(days=self.mjd)
 
         elif utc:
             if isinstance(utc, str):
-                self.utc = datetime.strptime(utc, "%Y-%m-%d %H:%M:%S.%f")
+                self.utc = datetime.fromisoformat(utc)
             elif isinstance(utc, datetime):
                 self.utc = utc
 
-            self.mjd = (self.utc - self.epoch).total_seconds() / 86400.0
+            self.mjd = (self.utc - self.EPOCH).total_seconds() / 86400.0
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def of(cls, mjd: float) -> 'Date':
+        """ Returns a cached Date for the provided MJD. Instances are shared
+        between callers, so they must not be modified.
+
+        :param mjd: modified julian date
+        :return: Date object
+        """
+        return cls(mjd=mjd)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def of_utc(cls, utc: str | datetime) -> 'Date':
+        """ Returns a cached Date for the provided UTC date. Instances are
+        shared between callers, so they must not be modified.
+
+        :param utc: UTC date string or datetime
+        :return: Date object
+        """
+        return cls(utc=utc)
 
     def __sub__(self, other) -> float:
         """ Defines the subtraction between two Date objects.
@@ -28,6 +55,40 @@ class Date:
 
         return round((self.mjd - other.mjd), 5)
 
+    @classmethod
+    def mjds_to_utc(cls, mjds: np.ndarray) -> np.ndarray:
+        """ Converts an array of MJDs to UTC without constructing a Date
+        object per element.
+
+        :param mjds: modified julian dates
+        :return: datetime64[us] array of UTC dates
+        """
+        micros = np.asarray(mjds, dtype=np.float64) * 86400.0e6
+        return np.datetime64(cls.EPOCH, 'us') + micros.astype('timedelta64[us]')
+
+    @classmethod
+    def utcs_to_mjd(cls, utcs: np.ndarray) -> np.ndarray:
+        """ Converts an array of UTC dates to MJDs without constructing a
+        Date object per element.
+
+        :param utcs: datetime64 array or ISO 8601 strings of UTC dates
+        :return: float64 array of modified julian dates
+        """
+        utcs = np.asarray(utcs, dtype='datetime64[us]')
+        return (utcs - np.datetime64(cls.EPOCH, 'us')) / np.timedelta64(1, 'D')
+
+    @staticmethod
+    def days_since(start: str | datetime, utcs: np.ndarray) -> np.ndarray:
+        """ Calculates the number of days between a starting date and each
+        of the provided UTC dates using datetime64 arithmetic.
+
+        :param start: ISO 8601 string or datetime of the starting date
+        :param utcs: datetime64 array or ISO 8601 strings of UTC dates
+        :return: float64 array of days since the starting date
+        """
+        utcs = np.asarray(utcs, dtype='datetime64[us]')
+        return (utcs - np.datetime64(start, 'us')) / np.timedelta64(1, 'D')
+
 
 if __name__ == "__main__":
 
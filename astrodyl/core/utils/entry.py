@@ -1,6 +1,33 @@
+import re
+
+import numpy as np
+
 from astrodyl.core.math.bounded_value import BoundedValue
 
 
+# Bounded values are formatted as 'value +upper -lower'
+_NUMBER = r'([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)'
+_BOUNDED = re.compile(rf'\s*{_NUMBER}\s+{_NUMBER}\s+{_NUMBER}')
+
+
+def parse_bounded(text: str, grb_id: str, name: str) -> BoundedValue:
+    """ Parses a bounded value field formatted as 'value +upper -lower'.
+    Raises a ValueError naming the field if the text does not match.
+
+    :param text: bounded value string
+    :param grb_id: identifier of the GRB the field belongs to
+    :param name: field name used in the error message
+    :return: BoundedValue object
+    """
+    match = _BOUNDED.match(text)
+    if match is None:
+        raise ValueError(f"Malformed {name} for {grb_id}: {text!r}.")
+
+    value, upper, lower = match.groups()
+
+    return BoundedValue(float(value), abs(float(lower)), float(upper))
+
+
 class GRB:
     def __init__(self, line: str = None):
         self.id = None
@@ -15,11 +42,25 @@ class GRB:
     def parse(self, line: str):
         """ Parses a line from the grb_list_liao.txt file.
         """
-        viewing = line[3].replace('+', '').split(' ')
-        opening = line[4].replace('+', '').split(' ')
-
         self.id = line[0]
-        self.viewing = BoundedValue(float(viewing[0]), abs(float(viewing[2])), float(viewing[1]))
-        self.opening = BoundedValue(float(opening[0]), abs(float(opening[2])), float(opening[1]))
+        self.viewing = parse_bounded(line[3], line[0], 'viewing angle')
+        self.opening = parse_bounded(line[4], line[0], 'opening angle')
         self.ratio = self.viewing / self.opening
         self.off_axis_confidence = float(line[5])
+
+
+class GRBTable:
+    def __init__(self, grbs: list):
+        """ Columnar view of a list of GRB entries. Each quantity is stored
+        as its own array so catalog-wide operations can be vectorized.
+
+        :param grbs: list of GRB objects
+        """
+        count = len(grbs)
+
+        self.ids = np.array([grb.id for grb in grbs], dtype=str)
+        self.viewing_values = np.fromiter((grb.viewing.value for grb in grbs), np.float64, count)
+        self.viewing_lowers = np.fromiter((grb.viewing.lower for grb in grbs), np.float64, count)
+        self.viewing_uppers = np.fromiter((grb.viewing.upper for grb in grbs), np.float64, count)
+        self.opening_values = np.fromiter((grb.opening.value for grb in grbs), np.float64, count)
+        self.confidences = np.fromiter((grb.off_axis_confidence for grb in grbs), np.float64, count)
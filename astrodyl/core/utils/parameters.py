@@ -2,6 +2,8 @@ from astrodyl.skynet.defns.filter import Filter
 
 
 class Parameters:
+    __slots__ = ('filter', 'time', 'magnitude')
+
     def __init__(self, filter_: Filter, time: float, magnitude: float):
         """
         :param filter_: filter used in the image
@@ -1,3 +1,4 @@
+import numpy as np
 
 
 """
@@ -5,15 +6,43 @@
 
     Swift's XRT has multiple data modes (e.g., photon counting,
     windowed timing) each of which contain the same type of data.
+    Each quantity is stored as its own contiguous float64 array.
 """
 
 
 class XRTDataMode:
+    __slots__ = ('times', 'time_lowers', 'time_uppers', 'fluxes', 'flux_lowers', 'flux_uppers')
+
     def __init__(self):
-        self.times: list = []
-        self.time_lowers: list = []
-        self.time_uppers: list = []
+        self.times: np.ndarray = np.empty(0, dtype=np.float64)
+        self.time_lowers: np.ndarray = np.empty(0, dtype=np.float64)
+        self.time_uppers: np.ndarray = np.empty(0, dtype=np.float64)
+
+        self.fluxes: np.ndarray = np.empty(0, dtype=np.float64)
+        self.flux_lowers: np.ndarray = np.empty(0, dtype=np.float64)
+        self.flux_uppers: np.ndarray = np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def from_arrays(cls, times, time_lowers, time_uppers, fluxes, flux_lowers, flux_uppers):
+        """ Creates a data mode from existing columns. Float64 arrays are
+        stored without being copied.
+
+        :param times: times since the BAT trigger
+        :param time_lowers: magnitudes of the negative time errors
+        :param time_uppers: magnitudes of the positive time errors
+        :param fluxes: fluxes or count rates
+        :param flux_lowers: magnitudes of the negative flux errors
+        :param flux_uppers: magnitudes of the positive flux errors
+        :return: XRTDataMode holding the provided columns
+        """
+        mode = cls()
+
+        mode.times = np.asarray(times, dtype=np.float64)
+        mode.time_lowers = np.asarray(time_lowers, dtype=np.float64)
+        mode.time_uppers = np.asarray(time_uppers, dtype=np.float64)
+
+        mode.fluxes = np.asarray(fluxes, dtype=np.float64)
+        mode.flux_lowers = np.asarray(flux_lowers, dtype=np.float64)
+        mode.flux_uppers = np.asarray(flux_uppers, dtype=np.float64)
 
-        self.fluxes: list = []
-        self.flux_lowers: list = []
-        self.flux_uppers: list = []
\ No newline at end of file
+        return mode
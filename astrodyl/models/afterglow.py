@@ -1,7 +1,11 @@
+import functools
 import math
 
+import numpy as np
+
 from astrodyl.core.utils.parameters import Parameters
 from astrodyl.core.astro.transient import Transient
+from astrodyl.skynet.defns.filter import Filter
 from astrodyl.skynet.defns.hardware import Hardware
 
 
@@ -16,6 +20,33 @@ from astrodyl.skynet.defns.hardware import Hardware
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _cardelli_ab(x: float) -> tuple:
+    """ Returns the a(x) and b(x) coefficients of Cardelli et al. (1989).
+    The Optical/NIR polynomials are evaluated using Horner's method. Results
+    are memoized per inverse wavelength, since only a handful of filters are
+    swapped in and out of a model.
+
+    :param x: inverse wavelength in units of inverse micro-meters
+    :return: tuple of (a, b)
+    """
+    # Infrared
+    if 0.3 <= x <= 1.1:
+        x_161 = x ** 1.61
+        return 0.574 * x_161, -0.527 * x_161
+
+    # Optical/NIR
+    if 1.1 < x <= 3.3:
+        y = x - 1.82
+        a = ((((((0.32999 * y - 0.7753) * y + 0.01979) * y + 0.72085) * y
+               - 0.02427) * y - 0.50447) * y + 0.17699) * y + 1.0
+        b = ((((((-2.09002 * y + 5.3026) * y - 0.62251) * y - 5.38434) * y
+               + 1.07233) * y + 2.28305) * y + 1.41338) * y
+        return a, b
+
+    return 0.0, 0.0
+
+
 class Afterglow:
     def __init__(self, transient: Transient, hardware: Hardware, params: Parameters,
                  snr: float, correction: float = None):
@@ -26,6 +57,95 @@ class Afterglow:
         self.correction_factor = correction
         self.desired_snr = snr
 
+        self.precompute()
+
+    def precompute(self) -> None:
+        """ Caches the contributions that do not depend on time. The model
+        calls this itself once any of the inputs returned by `get_state` are
+        modified in place, so calling it explicitly is optional.
+        """
+        self._state = self.get_state()
+
+        # Filter specific contributions, filled lazily by `get_filter_terms`
+        self._filter_terms = {}
+
+        transient, reference = self.transient, self.reference_parameters
+
+        # Bound here so the per-time methods avoid chained attribute lookups
+        self._trigger = transient.trigger_time
+        self._alpha = transient.temporal_index
+        self._ref_mag = reference.magnitude
+        self._ref_time_inv = 1.0 / reference.time
+
+        self._filter = self.hardware.filter
+        self._log10_spec_over_zp, self._ext_dep, self._exposure_factor = self.get_filter_terms(self._filter)
+
+    def get_state(self) -> tuple:
+        """ Returns the inputs, other than the hardware's filter, that the
+        cached contributions depend on.
+
+        :return: tuple of the model inputs
+        """
+        transient, reference, telescope = self.transient, self.reference_parameters, self.hardware.telescope
+
+        return (transient.trigger_time, transient.temporal_index, transient.spectral_index, transient.ebv,
+                reference.time, reference.magnitude, reference.filter,
+                telescope, telescope.efficiency, self.desired_snr, self.correction_factor)
+
+    def refresh(self) -> None:
+        """ Recomputes the cached contributions if the model inputs or the
+        hardware's filter were modified in place since they were cached.
+        """
+        if self.get_state() != self._state:
+            self.precompute()
+        elif self.hardware.filter is not self._filter:
+            self.filter = self.hardware.filter
+
+    def get_filter_terms(self, filter_: Filter) -> tuple:
+        """ Returns the time-independent contributions for the provided
+        filter. Results are cached until the next call to `precompute`,
+        so callers are expected to have called `refresh` first.
+
+        :param filter_: filter to evaluate the contributions for
+        :return: tuple of (log10 of the spectral over the zero point
+            dependence, extinction dependence, exposure factor)
+        """
+        terms = self._filter_terms.get(filter_)
+
+        if terms is None:
+            # log10(ratio ** b) == b * log10(ratio), avoiding the power
+            log10_spec_over_zp = (
+                self.transient.spectral_index
+                * math.log10(filter_.frequency / self.reference_parameters.filter.frequency)
+                - math.log10(self.get_zero_point_dependence(filter_)))
+
+            # SNR, hardware and correction factors only ever appear as a product
+            exposure_factor = (self.get_snr_dependence() * self.get_hardware_dependence(filter_)
+                               * (self.correction_factor or 1.0))
+
+            terms = self._filter_terms[filter_] = (
+                log10_spec_over_zp, self.get_extinction_dependence(filter_=filter_), exposure_factor)
+
+        return terms
+
+    @property
+    def filter(self) -> Filter:
+        """ Returns the filter of the modeled hardware.
+
+        :return: filter used to model the exposures
+        """
+        return self.hardware.filter
+
+    @filter.setter
+    def filter(self, filter_: Filter) -> None:
+        """ Swaps the filter of the modeled hardware and loads the cached
+        contributions that depend on it.
+
+        :param filter_: filter used to model the exposures
+        """
+        self.hardware.filter = self._filter = filter_
+        self._log10_spec_over_zp, self._ext_dep, self._exposure_factor = self.get_filter_terms(filter_)
+
     def get_snr_dependence(self) -> float:
         """ Returns the signal-to-noise ratio factor for a desired SNR.
         Assumes that the noise is purely Poisson such that is proportional
@@ -35,68 +155,43 @@ class Afterglow:
         """
         return (self.desired_snr / 5.0) ** 2.0
 
-    def get_hardware_dependence(self) -> float:
+    def get_hardware_dependence(self, filter_: Filter = None) -> float:
         """ Returns the contribution due to the hardware efficiencies.
         Filter efficiencies are stored as a value between 0.0 and 1.0,
         while the telescope efficiencies are defined as the inverse
         time needed to achieve an SNR of 5 at a limiting magnitude.
 
+        :param filter_: optional filter, defaults to the hardware's filter
         :return: contribution of the hardware efficiencies
         """
         if self.hardware.telescope.efficiency == 0:
             raise ValueError("Telescopes cannot have a 0 efficiency.")
 
+        filter_ = filter_ or self.hardware.filter
+
         open_filter_efficiency = 0.00929728
-        return ((self.hardware.filter.efficiency / open_filter_efficiency) /
+        return ((filter_.efficiency / open_filter_efficiency) /
                 self.hardware.telescope.efficiency)
 
-    def get_zero_point_dependence(self) -> float:
+    def get_zero_point_dependence(self, filter_: Filter = None) -> float:
         """ Returns the zero point contribution
 
+        :param filter_: optional filter, defaults to the hardware's filter
         :return: contribution of the filter zero point dependencies
         """
-        return self.hardware.filter.zero_point / self.reference_parameters.filter.zero_point
-
-    def get_temporal_dependence(self, time: float) -> float:
-        """ Calculates the temporal contribution
+        filter_ = filter_ or self.hardware.filter
+        return filter_.zero_point / self.reference_parameters.filter.zero_point
 
-        :param time: number of seconds since the transient trigger time
-        :return: contribution of the temporal dependence
-        """
-        return (((time - self.transient.trigger_time) / self.reference_parameters.time)
-                ** self.transient.temporal_index)
-
-    def get_spectral_dependence(self) -> float:
-        """ Calculates the spectral contribution
-
-        :return:contribution of the spectral dependence
-        """
-        return ((self.hardware.filter.frequency / self.reference_parameters.filter.frequency)
-                ** self.transient.spectral_index)
-
-    def get_extinction_dependence(self, r_v: float = 3.1) -> float:
+    def get_extinction_dependence(self, r_v: float = 3.1, filter_: Filter = None) -> float:
         """ Calculates the dust extinction contribution for the extinguished
         power law model. Implemented from Cardelli et al. (1989).
 
         :param r_v: extinction coefficient in V band
+        :param filter_: optional filter, defaults to the hardware's filter
         :return: contribution of the dust extinction dependence
         """
-        x = 1.0 / self.hardware.filter.wavelength(micro=True)
-        y = x - 1.82
-        a, b = 0.0, 0.0
-
-        # Infrared
-        if 0.3 <= x <= 1.1:
-            a = 0.574 * x ** 1.61
-            b = -0.527 * x ** 1.61
-
-        # Optical/NIR
-        elif 1.1 < x <= 3.3:
-            a = (1 + 0.17699 * y - 0.50447 * y ** 2 - 0.02427 * y ** 3 +
-                 0.72085 * y ** 4 + 0.01979 * y ** 5 - 0.7753 * y ** 6 + 0.32999 * y ** 7)
-            b = (1.41338 * y + 2.28305 * y ** 2 + 1.07233 * y ** 3 -
-                 5.38434 * y ** 4 - 0.62251 * y ** 5 + 5.3026 * y ** 6 - 2.09002 * y ** 7)
-
+        filter_ = filter_ or self.hardware.filter
+        a, b = _cardelli_ab(1.0 / filter_.wavelength(micro=True))
         return r_v * self.transient.ebv * (a + b / r_v)
 
     def magnitude(self, time: float) -> float:
@@ -106,11 +201,12 @@ class Afterglow:
         :param time: number of seconds since the transient trigger time
         :return: modeled magnitude at the provided time
         """
-        return (self.reference_parameters.magnitude -
-                (2.5 * (math.log10(self.get_temporal_dependence(time))
-                        + math.log10(self.get_spectral_dependence())
-                        - math.log10(self.get_zero_point_dependence())))
-                + self.get_extinction_dependence())
+        self.refresh()
+
+        return (self._ref_mag -
+                2.5 * (self._alpha * math.log10((time - self._trigger) * self._ref_time_inv)
+                       + self._log10_spec_over_zp)
+                + self._ext_dep)
 
     def exposure_length(self, time: float, magnitude: float = None) -> float:
         """ Calculates the exposure length for a given time and desired SNR
@@ -122,6 +218,95 @@ class Afterglow:
         """
         if magnitude is None:
             magnitude = self.magnitude(time)
+        else:
+            self.refresh()
+
+        return self._exposure_factor * 10.0 ** ((magnitude - 20.0) / 2.5)
+
+    def magnitude_array(self, times: np.ndarray) -> np.ndarray:
+        """ Models the magnitudes at each of the provided times given the
+        reference parameters. Vectorized equivalent of `magnitude`.
+
+        :param times: number of seconds since the transient trigger time
+        :return: modeled magnitudes at the provided times
+        """
+        self.refresh()
+        times = np.asarray(times, dtype=np.float64)
+
+        temporal = self._alpha * np.log10((times - self._trigger) * self._ref_time_inv)
+
+        return (self._ref_mag -
+                2.5 * (temporal + self._log10_spec_over_zp)
+                + self._ext_dep)
+
+    def exposure_length_array(self, times: np.ndarray, magnitudes: np.ndarray = None) -> np.ndarray:
+        """ Calculates the exposure lengths for each of the provided times
+        and desired SNR. Vectorized equivalent of `exposure_length`.
+
+        :param times: number of seconds since the transient trigger time
+        :param magnitudes: optional magnitudes if already known
+        :return: exposure lengths in seconds
+        """
+        if magnitudes is None:
+            magnitudes = self.magnitude_array(times)
+        else:
+            self.refresh()
+
+        return self._exposure_factor * np.power(10.0, (np.asarray(magnitudes, dtype=np.float64) - 20.0) / 2.5)
+
+    def magnitude_all(self, time: float, filters: list) -> dict:
+        """ Models the magnitude at the provided time in each of the provided
+        filters without swapping the hardware's filter.
+
+        :param time: number of seconds since the transient trigger time
+        :param filters: filters to model the magnitudes in
+        :return: dictionary of modeled magnitudes keyed by filter name
+        """
+        self.refresh()
+
+        temporal = self._alpha * math.log10((time - self._trigger) * self._ref_time_inv)
+
+        magnitudes = {}
+        for filter_ in filters:
+            log10_spec_over_zp, ext_dep, _ = self.get_filter_terms(filter_)
+            magnitudes[filter_.name] = self._ref_mag - 2.5 * (temporal + log10_spec_over_zp) + ext_dep
+
+        return magnitudes
+
+    def exposure_length_all(self, time: float, filters: list, magnitudes: dict = None) -> dict:
+        """ Calculates the exposure length at the provided time in each of
+        the provided filters without swapping the hardware's filter.
+
+        :param time: number of seconds since the transient trigger time
+        :param filters: filters to calculate the exposure lengths in
+        :param magnitudes: optional magnitudes keyed by filter name if already known
+        :return: dictionary of exposure lengths in seconds keyed by filter name
+        """
+        if magnitudes is None:
+            magnitudes = self.magnitude_all(time, filters)
+        else:
+            self.refresh()
+
+        return {filter_.name: self.get_filter_terms(filter_)[2] * 10.0 ** ((magnitudes[filter_.name] - 20.0) / 2.5)
+                for filter_ in filters}
+
+    def exposure_length_grid(self, times: np.ndarray, filters: list) -> np.ndarray:
+        """ Calculates the exposure lengths for each of the provided times in
+        each of the provided filters without swapping the hardware's filter.
+        The per-filter terms are stacked into column arrays and broadcast
+        against the times, so the temporal term is only evaluated once.
+
+        :param times: number of seconds since the transient trigger time
+        :param filters: filters to calculate the exposure lengths in
+        :return: array of exposure lengths with one row per filter
+        """
+        self.refresh()
+        times = np.asarray(times, dtype=np.float64)
+        terms = np.array([self.get_filter_terms(filter_) for filter_ in filters], dtype=np.float64)
+
+        log10_spec_over_zp, ext_dep, exposure_factor = terms[:, 0:1], terms[:, 1:2], terms[:, 2:3]
+
+        temporal = self._alpha * np.log10((times - self._trigger) * self._ref_time_inv)
+        magnitudes = self._ref_mag - 2.5 * (temporal + log10_spec_over_zp) + ext_dep
 
-        return (self.get_snr_dependence() * self.get_hardware_dependence()
-                * (10.0 ** ((magnitude - 20.0) / 2.5)) * (self.correction_factor or 1.0))
+        return exposure_factor * np.power(10.0, (magnitudes - 20.0) / 2.5)
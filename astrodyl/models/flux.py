@@ -1,3 +1,4 @@
+import numpy as np
 
 
 """
@@ -12,7 +13,13 @@
 """
 
 
+FOUR_THIRDS = 4 / 3
+ONE_HALF = 1 / 2
+
+
 class Flux:
+    __slots__ = ('peak_flux', 'cooling_frequency', 'synchrotron_frequency', 'spectral_index')
+
     def __init__(self, **kw):
         """ Super class containing the characteristic break frequencies,
         peak flux, and spectral index.
@@ -31,6 +38,8 @@ class Flux:
 
 
 class FluxSlowCoolingSpectral(Flux):
+    __slots__ = ('frequency',)
+
     def __init__(self, frequency: float, **kw):
         """ Implements the slow cooling spectral flux model in section 2,
         equation 7.
@@ -53,15 +62,33 @@ class FluxSlowCoolingSpectral(Flux):
             return self.peak_flux * (self.frequency / self.synchrotron_frequency) ** (1 / 3)
 
         if self.frequency < self.cooling_frequency:
-            return self.peak_flux * (self.frequency / self.synchrotron_frequency) ** -(self.spectral_index - 1) / 2
+            return self.peak_flux * (self.frequency / self.synchrotron_frequency) ** (-(self.spectral_index - 1) / 2)
 
         if self.frequency >= self.cooling_frequency:
             return (self.peak_flux *
                     ((self.cooling_frequency / self.synchrotron_frequency) ** (-(self.spectral_index - 1) / 2)) *
                     ((self.frequency / self.cooling_frequency) ** (-self.spectral_index / 2)))
 
+    def flux_array(self, frequencies: np.ndarray) -> np.ndarray:
+        """ Vectorized equivalent of `flux` for an array of frequencies.
+        Each segment is selected with the same comparisons as `flux`.
+
+        :param frequencies: measured in Hz
+        :return: spectral fluxes in units of erg / s / cm^2 / Hz
+        """
+        nu = np.asarray(frequencies, dtype=np.float64)
+        nu_m, nu_c, p = self.synchrotron_frequency, self.cooling_frequency, self.spectral_index
+
+        return self.peak_flux * np.select(
+            [nu <= nu_m, nu < nu_c],
+            [(nu / nu_m) ** (1 / 3), (nu / nu_m) ** (-(p - 1) / 2)],
+            default=((nu_c / nu_m) ** (-(p - 1) / 2)) * ((nu / nu_c) ** (-p / 2)))
+
 
 class FluxSlowCoolingIntegrated(Flux):
+    __slots__ = ('lower_frequency', 'upper_frequency', '_exponent_g', '_exponent_h',
+                 '_prefactor_f', '_prefactor_g', '_prefactor_h')
+
     def __init__(self, bounds: tuple, **kw):
         """ Integrates the slow cooling spectral flux model of Sari et
         al. (1998).
@@ -80,6 +107,16 @@ class FluxSlowCoolingIntegrated(Flux):
         self.lower_frequency = bounds[0]
         self.upper_frequency = bounds[1]
 
+        # Segment prefactors and exponents do not depend on the bounds
+        p = self.spectral_index
+        self._exponent_g = (3 - p) / 2
+        self._exponent_h = (2 - p) / 2
+        self._prefactor_f = 0.75 * self.peak_flux * self.synchrotron_frequency ** (-1 / 3)
+        self._prefactor_g = (2 / (3 - p)) * self.peak_flux * self.synchrotron_frequency ** ((p - 1) / 2)
+        self._prefactor_h = (self.peak_flux * (2 / (2 - p)) *
+                             ((self.cooling_frequency / self.synchrotron_frequency) ** (-(p - 1) / 2)) *
+                             (self.cooling_frequency ** (p / 2)))
+
     def integrate(self) -> float:
         """ Calculates the integrated flux for a range of frequencies by
         integrating the slow cooling set of equations (section 2, equation
@@ -115,6 +152,27 @@ class FluxSlowCoolingIntegrated(Flux):
         # Entire frequency range is within segment H
         return self.integrate_segment_h(self.lower_frequency, self.upper_frequency)
 
+    def integrate_array(self, lowers: np.ndarray, uppers: np.ndarray) -> np.ndarray:
+        """ Vectorized equivalent of `integrate` for arrays of frequency
+        ranges. Both bounds are clipped to each segment so that segments
+        outside of a range contribute nothing to its integral.
+
+        :param lowers: lower integration bounds measured in Hz
+        :param uppers: upper integration bounds measured in Hz
+        :return: integrated fluxes in units of erg / s / cm^2
+        """
+        lowers = np.asarray(lowers, dtype=np.float64)
+        uppers = np.asarray(uppers, dtype=np.float64)
+
+        if np.any(lowers > uppers):
+            raise ValueError('Arguments `lowers` and `uppers` were provided in reverse order.')
+
+        first, second = self.synchrotron_frequency, self.cooling_frequency
+
+        return (self.integrate_segment_f(np.minimum(lowers, first), np.minimum(uppers, first)) +
+                self.integrate_segment_g(np.clip(lowers, first, second), np.clip(uppers, first, second)) +
+                self.integrate_segment_h(np.maximum(lowers, second), np.maximum(uppers, second)))
+
     def integrate_segment_f(self, lower: float, upper: float) -> float:
         """ Integrates the slow cooling flux equation for segment B in
         Sari et al. (1998). See section 2, equation 7. If you aren't
@@ -125,8 +183,7 @@ class FluxSlowCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return ((3 / 4) * (self.peak_flux / self.synchrotron_frequency ** (1 / 3)) *
-                (upper ** (4 / 3) - lower ** (4 / 3)))
+        return self._prefactor_f * (upper ** FOUR_THIRDS - lower ** FOUR_THIRDS)
 
     def integrate_segment_g(self, lower: float, upper: float) -> float:
         """ Integrates the slow cooling flux equation for segment C in
@@ -138,9 +195,7 @@ class FluxSlowCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return ((2 / (3 - self.spectral_index)) * self.peak_flux *
-                (1 / self.synchrotron_frequency ** (-(self.spectral_index - 1) / 2)) *
-                (upper ** ((3 - self.spectral_index) / 2) - lower ** ((3 - self.spectral_index) / 2)))
+        return self._prefactor_g * (upper ** self._exponent_g - lower ** self._exponent_g)
 
     def integrate_segment_h(self, lower: float, upper: float) -> float:
         """ Integrates the slow cooling flux equation for segment D in
@@ -152,13 +207,12 @@ class FluxSlowCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return (self.peak_flux * (2 / (2 - self.spectral_index)) *
-                ((self.cooling_frequency / self.synchrotron_frequency) ** (-(self.spectral_index - 1) / 2)) *
-                (self.cooling_frequency ** (self.spectral_index / 2)) *
-                (upper ** ((2 - self.spectral_index) / 2) - lower ** ((2 - self.spectral_index) / 2)))
+        return self._prefactor_h * (upper ** self._exponent_h - lower ** self._exponent_h)
 
 
 class FluxFastCoolingSpectral(Flux):
+    __slots__ = ('frequency',)
+
     def __init__(self, frequency: float, **kw):
         """ Implements the fast cooling spectral flux model in section 2,
         equation 7.
@@ -187,8 +241,26 @@ class FluxFastCoolingSpectral(Flux):
             return (self.peak_flux * ((self.synchrotron_frequency / self.cooling_frequency) ** (-1 / 2)) *
                     ((self.frequency / self.synchrotron_frequency) ** (-self.spectral_index / 2)))
 
+    def flux_array(self, frequencies: np.ndarray) -> np.ndarray:
+        """ Vectorized equivalent of `flux` for an array of frequencies.
+        Each segment is selected with the same comparisons as `flux`.
+
+        :param frequencies: measured in Hz
+        :return: spectral fluxes in units of erg / s / cm^2 / Hz
+        """
+        nu = np.asarray(frequencies, dtype=np.float64)
+        nu_m, nu_c, p = self.synchrotron_frequency, self.cooling_frequency, self.spectral_index
+
+        return self.peak_flux * np.select(
+            [nu <= nu_c, nu < nu_m],
+            [(nu / nu_c) ** (1 / 3), (nu / nu_c) ** (-1 / 2)],
+            default=((nu_m / nu_c) ** (-1 / 2)) * ((nu / nu_m) ** (-p / 2)))
+
 
 class FluxFastCoolingIntegrated(Flux):
+    __slots__ = ('lower_frequency', 'upper_frequency', '_exponent_d',
+                 '_prefactor_b', '_prefactor_c', '_prefactor_d')
+
     def __init__(self, bounds: tuple, **kw):
         """ Integrates the fast cooling spectral flux model of Sari et
         al. (1998).
@@ -207,6 +279,15 @@ class FluxFastCoolingIntegrated(Flux):
         self.lower_frequency = bounds[0]
         self.upper_frequency = bounds[1]
 
+        # Segment prefactors and exponents do not depend on the bounds
+        p = self.spectral_index
+        self._exponent_d = (2 - p) / 2
+        self._prefactor_b = 0.75 * self.peak_flux * self.cooling_frequency ** (-1 / 3)
+        self._prefactor_c = 2 * self.peak_flux * self.cooling_frequency ** ONE_HALF
+        self._prefactor_d = (self.peak_flux * (2 / (2 - p)) *
+                             ((self.synchrotron_frequency / self.cooling_frequency) ** (-1 / 2)) *
+                             (self.synchrotron_frequency ** (p / 2)))
+
     def integrate(self) -> float:
         """ Calculates the integrated flux for a range of frequencies by
         integrating the fast cooling set of equations (section 2, equation
@@ -242,6 +323,27 @@ class FluxFastCoolingIntegrated(Flux):
         # Entire frequency range is within segment D
         return self.integrate_segment_d(self.lower_frequency, self.upper_frequency)
 
+    def integrate_array(self, lowers: np.ndarray, uppers: np.ndarray) -> np.ndarray:
+        """ Vectorized equivalent of `integrate` for arrays of frequency
+        ranges. Both bounds are clipped to each segment so that segments
+        outside of a range contribute nothing to its integral.
+
+        :param lowers: lower integration bounds measured in Hz
+        :param uppers: upper integration bounds measured in Hz
+        :return: integrated fluxes in units of erg / s / cm^2
+        """
+        lowers = np.asarray(lowers, dtype=np.float64)
+        uppers = np.asarray(uppers, dtype=np.float64)
+
+        if np.any(lowers > uppers):
+            raise ValueError('Arguments `lowers` and `uppers` were provided in reverse order.')
+
+        first, second = self.cooling_frequency, self.synchrotron_frequency
+
+        return (self.integrate_segment_b(np.minimum(lowers, first), np.minimum(uppers, first)) +
+                self.integrate_segment_c(np.clip(lowers, first, second), np.clip(uppers, first, second)) +
+                self.integrate_segment_d(np.maximum(lowers, second), np.maximum(uppers, second)))
+
     def integrate_segment_b(self, lower: float, upper: float) -> float:
         """ Integrates the fast cooling flux equation for segment B in
         Sari et al. (1998). See section 2, equation 7. If you aren't
@@ -252,8 +354,7 @@ class FluxFastCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return ((3 / 4) * (self.peak_flux / self.cooling_frequency ** (1 / 3)) *
-                (upper ** (4 / 3) - lower ** (4 / 3)))
+        return self._prefactor_b * (upper ** FOUR_THIRDS - lower ** FOUR_THIRDS)
 
     def integrate_segment_c(self, lower: float, upper: float) -> float:
         """ Integrates the fast cooling flux equation for segment C in
@@ -265,8 +366,7 @@ class FluxFastCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return (2 * (self.peak_flux / self.cooling_frequency ** -(1 / 2)) *
-                (upper ** (1 / 2) - lower ** (1 / 2)))
+        return self._prefactor_c * (upper ** ONE_HALF - lower ** ONE_HALF)
 
     def integrate_segment_d(self, lower: float, upper: float) -> float:
         """ Integrates the fast cooling flux equation for segment D in
@@ -278,7 +378,4 @@ class FluxFastCoolingIntegrated(Flux):
         :param upper: upper integration bound
         :return: integrated flux in units of erg / s / cm^2
         """
-        return (self.peak_flux * (2 / (2 - self.spectral_index)) *
-                ((self.synchrotron_frequency / self.cooling_frequency) ** (-1 / 2)) *
-                (self.synchrotron_frequency ** (self.spectral_index / 2)) *
-                (upper ** ((2 - self.spectral_index) / 2) - lower ** ((2 - self.spectral_index) / 2)))
+        return self._prefactor_d * (upper ** self._exponent_d - lower ** self._exponent_d)
@@ -1,4 +1,5 @@
 import json
+import numpy as np
 import pandas as pd
 
 
@@ -14,8 +15,8 @@ def load_json(path: str):
 
 
 def load_excel(path: str):
-    """ Loads teh GRB data """
-    return pd.ExcelFile(path)
+    """ Loads the photometry times of every GRB sheet in a single pass """
+    return pd.read_excel(path, sheet_name=None, usecols=['days_since'])
 
 
 if __name__ == '__main__':
@@ -26,30 +27,23 @@ if __name__ == '__main__':
     break_data, grb_data = load_data(r"C:\Projects\repos\grb\grb\resources\break_times.json",
                                      r"C:\Users\Dylan\Documents\grb_final.xlsx")
 
-    for sheet_name in grb_data.sheet_names:
-        breaks_with_data = []
+    for sheet_name, df in grb_data.items():
+        # Sorted photometry times (s) so pre- and post-break counts are lookups
+        times = np.sort(df['days_since'].dropna().to_numpy(dtype=np.float64) * 86400.0)
+        breaks = np.asarray(break_data[sheet_name], dtype=np.float64)
 
-        # Read the data for a particular GRB event
-        df = pd.read_excel(grb_data, sheet_name=sheet_name)
+        # Determine if the photometry is pre- or post-break
+        before = np.searchsorted(times, breaks, side='left')
+        after = len(times) - np.searchsorted(times, breaks, side='right')
 
-        for break_time in break_data[sheet_name]:
-            before, after = 0, 0
-
-            # Determine if the photometry is pre- or post-break
-            for i, data_time in enumerate(df['days_since']):
-                if (data_time * 86400.0) < break_time:
-                    before += 1
-                elif (data_time * 86400.0) > break_time:
-                    after += 1
-
-            # Store the information if it passes criteria
-            if before >= min_points and after >= min_points:
-                breaks_with_data.append((before, after))
+        # Store the information if it passes criteria
+        mask = (before >= min_points) & (after >= min_points)
+        breaks_with_data = list(zip(before[mask].tolist(), after[mask].tolist()))
 
         if breaks_with_data:
             table[sheet_name] = breaks_with_data
 
     print('\n')
     print(f'+---------------------------------------------------------+')
-    print(f'| {len(table)} of {len(grb_data.sheet_names)} GRB events have at least {min_points} photometry points. |')
+    print(f'| {len(table)} of {len(grb_data)} GRB events have at least {min_points} photometry points. |')
     print(f'+---------------------------------------------------------+')
@@ -1,8 +1,8 @@
-import math
-
+import numpy as np
 import mplcursors
 from matplotlib import pyplot as plt
 
+from astrodyl.core.utils.entry import GRBTable
 from astrodyl.scripts.parsers.liao import Liao
 from astrodyl.scripts.parsers.ryan import Ryan
 
@@ -20,39 +20,29 @@ def plot(grbs: list):
             - Mild: 3 <= sigma < 5
             - Low: sigma < 3
         """
-    snr_0, lower_0, labels_low = [], [], []
-    snr_3, lower_3, labels_3 = [], [], []
-    snr_5, lower_5, labels_5 = [], [], []
-
-    for grb in grbs:
-        snr = math.degrees(grb.viewing.value) / math.degrees(grb.viewing.lower)
-        viewing = math.degrees(grb.viewing.value)
-
-        label = grb.id + '(' + str(round(viewing, 2)) + ',' + str(round(snr, 2)) + ')'
-
-        if grb.off_axis_confidence >= 5.0:
-            labels_5.append(label)
-            snr_5.append(snr)
-            lower_5.append(viewing)
-        elif grb.off_axis_confidence >= 3.0:
-            labels_3.append(label)
-            snr_3.append(snr)
-            lower_3.append(viewing)
-        else:
-            labels_low.append(label)
-            snr_0.append(snr)
-            lower_0.append(viewing)
+    table = GRBTable(grbs)
+
+    viewing = np.degrees(table.viewing_values)
+    snr = viewing / np.degrees(table.viewing_lowers)
+
+    high_mask = table.confidences >= 5.0
+    mild_mask = (table.confidences >= 3.0) & ~high_mask
+    low_mask = ~(high_mask | mild_mask)
+
+    # Hover labels are only formatted for the point under the cursor
+    high_indices = np.flatnonzero(high_mask)
 
     fig, ax = plt.subplots()
 
     # Plot High Confidence Angles
-    high = ax.scatter(lower_5, snr_5, color='green', label='High Confidence')
+    high = ax.scatter(viewing[high_mask], snr[high_mask], color='green', label='High Confidence',
+                      rasterized=True)
 
     # Plot Mild Confidence Angles
-    mild = ax.scatter(lower_3, snr_3, color='purple', label='Mild Confidence')
+    ax.scatter(viewing[mild_mask], snr[mild_mask], color='purple', label='Mild Confidence', rasterized=True)
 
     # Plot Low Confidence Angles
-    low = ax.scatter(lower_0, snr_0, color='black', label='Low Confidence')
+    ax.scatter(viewing[low_mask], snr[low_mask], color='black', label='Low Confidence', rasterized=True)
 
     ax.legend()
     ax.set_ylabel("Viewing Angle (degrees) / Lower Bound (degrees)")
@@ -64,8 +54,8 @@ def plot(grbs: list):
 
     @cursor.connect("add")
     def on_add(sel):
-        index = sel.index
-        sel.annotation.set(text=f'{labels_5[index]}')
+        index = high_indices[sel.index]
+        sel.annotation.set(text=f'{table.ids[index]}({round(viewing[index], 2)},{round(snr[index], 2)})')
         sel.annotation.get_bbox_patch().set(fc="white")
 
     plt.show()
@@ -75,26 +65,11 @@ if __name__ == '__main__':
     ryan = Ryan(r"/grb/resources/grbs_ryan_2015.txt")
     liao = Liao(r"/grb/resources/grbs_laio_2024.txt")
 
-    grb_ids = []
-    duplicates = []
-
-    for liao_grb in liao.grbs:
-        grb_ids.append(liao_grb.id)
-
-    for ryan_grb in ryan.grbs:
-        if ryan_grb.id in grb_ids:
-            duplicates.append(ryan_grb.id)
-        else:
-            grb_ids.append(ryan_grb.id)
-
-    grbs = []
-
-    for liao_grb in liao.grbs:
-        grbs.append(liao_grb)
+    # Liao et al. (2024) takes precedence for GRBs present in both tables
+    liao_ids = {grb.id for grb in liao.grbs}
 
-    for ryan_grb in ryan.grbs:
-        if ryan_grb.id not in duplicates:
-            grbs.append(ryan_grb)
+    grbs = list(liao.grbs)
+    grbs.extend(grb for grb in ryan.grbs if grb.id not in liao_ids)
 
     plot(grbs)
 
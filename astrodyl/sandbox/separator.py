@@ -1,3 +1,5 @@
+import re
+
 from astrodyl.core.io import txt
 
 """
@@ -19,6 +21,20 @@ from astrodyl.core.io import txt
         - Lorentz Boost
 """
 
+# Column index of each supported field
+_COLS = {
+    'date': 0,
+    'lorentz boost': 2,
+    'viewing angle': 3,
+    'opening angle': 4,
+    'viewing angle confidence': 5,
+}
+
+_FIELDS = frozenset(_COLS)
+
+# Matches every character that is not a digit
+_NON_DIGITS = re.compile(r'\D')
+
 
 def separate(lines: list, field: str, upper: float = None, lower: float = None, comment: str = '#'):
     """ Filters the lines of GRB list file based on specified field and specified bounds.
@@ -35,10 +51,10 @@ def separate(lines: list, field: str, upper: float = None, lower: float = None,
     if lower is None and upper is None:
         raise ValueError("No separating bounds were provided.")
 
-    if field not in ['date', 'viewing angle', 'opening angle', 'viewing angle confidence', 'Lorentz Boost']:
+    if field not in _FIELDS:
         raise ValueError(f"Field not supported: {field}.")
 
-    col = get_column(field)
+    col = _COLS[field]
 
     sep_lines = []
     for line in lines:
@@ -58,46 +74,28 @@ def is_value_within_limits(value: str, field: str, upper: float, lower: float):
 
     :param value: str value to check.
     :param field: field name to check.
-    :param upper: upper limit.
-    :param lower: lower limit.
+    :param upper: upper limit, or None to leave it unbounded.
+    :param lower: lower limit, or None to leave it unbounded.
     :return: True if value within limits (inclusive).
     """
     if field in ['date']:  # Sanitize date to be convertable to float
-        value = ''.join(char for char in value if char.isdigit())
+        value = _NON_DIGITS.sub('', value)
 
     # We don't care about the bounds
     if '+' in value or '-' in value:
         value = value.split(' ')[0]
 
-    if lower and float(value) < lower:
+    number = float(value)
+
+    if lower is not None and number < lower:
         return False
 
-    if upper and float(value) > upper:
+    if upper is not None and number > upper:
         return False
 
     return True
 
 
-def get_column(field: str) -> int:
-    """ Returns the integer column index corresponding to the specified
-    field.
-
-    :return: integer column index
-    """
-    if field == 'date':
-        return 0
-    if field == 'lorentz boost':
-        return 2
-    if field == 'viewing angle':
-        return 3
-    if field == 'opening angle':
-        return 4
-    if field == 'viewing angle confidence':
-        return 5
-
-    raise ValueError(f'Field {field} not recognized')
-
-
 if __name__ == '__main__':
     """ Main entry point for separator """
 
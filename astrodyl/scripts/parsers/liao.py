@@ -27,12 +27,13 @@ class Liao:
         :param comment: character for comments
         """
         self.grbs = []
+        append = self.grbs.append
 
         for line in lines:
             if line.startswith(comment):
                 continue
 
-            self.grbs.append(GRB(line.split('\t')))
+            append(GRB(line.split('\t')))
 
 
 if __name__ == '__main__':
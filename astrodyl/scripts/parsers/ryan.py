@@ -1,5 +1,4 @@
-from astrodyl.core.math.bounded_value import BoundedValue
-from astrodyl.core.utils.entry import GRB
+from astrodyl.core.utils.entry import GRB, parse_bounded
 from astrodyl.core.io import txt
 
 """
@@ -28,27 +27,30 @@ class Ryan:
         self.parse(txt.read(path))
 
     def parse(self, lines: list, comment: str = '#') -> None:
+        """ Parses the Gamma-Ray Burst table.
+
+        :param lines: list of grb data strings
+        :param comment: character for comments
+        """
         self.grbs = []
+        append = self.grbs.append
 
         for line in lines:
             if line.startswith(comment):
                 continue
 
-            line = line.split('\t')
+            grb_id, opening, ratio = line.split('\t')[:3]
 
             grb = GRB()
-            grb.id = line[0]
-
-            opening = line[1].replace('+', '').split(' ')
-            grb.opening = BoundedValue(float(opening[0]), abs(float(opening[2])), float(opening[1]))
+            grb.id = grb_id
 
-            ratio = line[2].replace('+', '').split(' ')
-            grb.ratio = BoundedValue(float(ratio[0]), abs(float(ratio[2])), float(ratio[1]))
+            grb.opening = parse_bounded(opening, grb_id, 'opening angle')
+            grb.ratio = parse_bounded(ratio, grb_id, 'angle ratio')
 
             grb.viewing = grb.ratio * grb.opening
             grb.off_axis_confidence = grb.viewing.value / grb.viewing.lower
 
-            self.grbs.append(grb)
+            append(grb)
 
 
 if __name__ == '__main__':
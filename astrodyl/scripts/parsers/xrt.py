@@ -1,4 +1,8 @@
+import io
 import os
+
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
 from astrodyl.core.utils.xrt_data_mode import XRTDataMode
@@ -17,11 +21,14 @@ from astrodyl.core.io import txt
     Data description: https://www.swift.ac.uk/xrt_curves/docs.php#products
 """
 
+# Prefixes of the header and empty mode rows
+_HEADERS = (b'READ', b'NO')
+
 
 class XRT:
     def __init__(self, path: str, event: str):
         self.path = path
-        self.data = txt.read(path)
+        self.data = txt.read_bytes(path)
         self.photon_counting = XRTDataMode()
         self.windowed_timing = XRTDataMode()
         self.event = event
@@ -40,59 +47,60 @@ class XRT:
             - Positive error in count rate (1-σ)
             - Negative error in count rate (1-σ)
         """
-        self.find_modes()
-        self.parse_mode(self.windowed_timing, self.wt_start, self.pc_start)
-        self.parse_mode(self.photon_counting, self.pc_start, len(self.data) - 1)
+        self.wt_start, self.pc_start = None, None
+        wt_rows, pc_rows = [], []
 
-    def find_modes(self) -> None:
-        """ Finds the starting point of each data mode. Raises a ValueError
-        exception if the WT or PC data could not be found.
-        """
+        # Rows are partitioned by mode in the same pass that finds the modes
+        rows = None
         for i, line in enumerate(self.data):
-            if line.startswith('READ') or line.startswith('NO'):
+            if line.startswith(b'!'):
+                self.get_mode_start(line, i)
+
+                if self.wt_start == i + 1:
+                    rows = wt_rows
+                elif self.pc_start == i + 1:
+                    rows = pc_rows
                 continue
 
-            self.get_mode_start(line, i)
+            if rows is not None and not line.startswith(_HEADERS):
+                rows.append(line)
 
         if self.wt_start is None or self.pc_start is None:
             raise ValueError(f"Missing data for {self.event}.")
 
-    def parse_mode(self, mode: XRTDataMode, start: int, stop: int) -> None:
-        """ Parses the data for a provided range corresponding to a
-        data mode.
+        self.windowed_timing = self.parse_rows(wt_rows)
+        self.photon_counting = self.parse_rows(pc_rows)
 
-        :param mode: XRTDataMode object
-        :param start: starting index
-        :param stop: stopping index
-        """
-        for i in range(start, stop):
-            row = self.data[i]
-
-            if row.startswith('READ') or row.startswith('NO') or row.startswith('!'):
-                continue
+    @staticmethod
+    def parse_rows(rows: list) -> XRTDataMode:
+        """ Parses the data rows of a single data mode.
 
-            data = row.split('\t')
+        :param rows: tab separated data rows as bytes
+        :return: XRTDataMode object
+        """
+        if not rows:
+            return XRTDataMode()
 
-            mode.times.append(float(data[0]))
-            mode.time_uppers.append(abs(float(data[1])))
-            mode.time_lowers.append(abs(float(data[2])))
+        df = pd.read_csv(io.BytesIO(b'\n'.join(rows)), sep='\t', header=None, usecols=range(6),
+                         dtype=np.float64, engine='c')
 
-            mode.fluxes.append(float(data[3]))
-            mode.flux_uppers.append(abs(float(data[4])))
-            mode.flux_lowers.append(abs(float(data[5])))
+        # DataFrame columns are contiguous, unlike the columns of a 2D array
+        return XRTDataMode.from_arrays(
+            times=df[0].to_numpy(), time_uppers=np.abs(df[1].to_numpy()), time_lowers=np.abs(df[2].to_numpy()),
+            fluxes=df[3].to_numpy(), flux_uppers=np.abs(df[4].to_numpy()), flux_lowers=np.abs(df[5].to_numpy()))
 
-    def get_mode_start(self, line: str, index: int) -> None:
+    def get_mode_start(self, line: bytes, index: int) -> None:
         """ Determines the starting point of the WT and PC data modes.
 
         :param line: line to check for data mode comment
         :param index: line index
         """
-        if line.startswith('!'):
-            mode = line.replace('!', '').strip()
+        if line.startswith(b'!'):
+            mode = line.replace(b'!', b'').strip()
 
-            if mode == 'WT':
+            if mode == b'WT':
                 self.wt_start = index + 1
-            elif mode == 'PC_incbad':
+            elif mode == b'PC_incbad':
                 self.pc_start = index + 1
 
     def plot(self, wt: bool = True, pc: bool = True) -> None:
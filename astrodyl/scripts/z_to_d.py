@@ -1,31 +1,37 @@
 import numpy as np
-from scipy.integrate import quad
+
+
+# Gauss-Legendre nodes and weights on [-1, 1] used for the distance integral
+NODES, WEIGHTS = np.polynomial.legendre.leggauss(32)
 
 
 class Distance:
-    def __init__(self, cmd: float, ld: float):
+    def __init__(self, cmd: float | np.ndarray, ld: float | np.ndarray):
         self.comoving = cmd
         self.luminosity = ld
 
 
-def convert_redshift_to_distance(z: float, h0: float = 71, o_m: float = 0.3, o_l: float = 0.7, o_k: float = 0):
+def convert_redshift_to_distance(z: float | np.ndarray, h0: float = 71, o_m: float = 0.3, o_l: float = 0.7,
+                                 o_k: float = 0):
     """
 
-    :param z: redshift
+    :param z: redshift, or an array of redshifts
     :param h0: Hubble's constant at redshift = 0
     :param o_m: density of matter (omega_matter)
     :param o_l: density of dark matter (omega_lambda)
     :param o_k: curvature density (0 = flat)
     :return:
     """
-    def e(rs: float) -> float:
+    z = np.asarray(z, dtype=np.float64)
+
+    def e(rs: np.ndarray) -> np.ndarray:
         """ Calculates the dimensionless Hubble Parameter
 
         :param rs: redshift
         """
         return np.sqrt(o_m * (1 + rs) ** 3 + o_k * (1 + rs) ** 2 + o_l)
 
-    def comoving_distance() -> float:
+    def comoving_distance() -> float | np.ndarray:
         """ Calculates the distance between two objects which remains
         constant with epoch if the two objects are moving with the Hubble
         flow. In other words, it is the distance between them which would
@@ -33,15 +39,21 @@ def convert_redshift_to_distance(z: float, h0: float = 71, o_m: float = 0.3, o_l
         proper distance) divided by the ratio of the scale factor of the
         Universe then to now.
 
+        The integral is evaluated with fixed order Gauss-Legendre quadrature
+        by mapping the nodes from [-1, 1] onto [0, z] for every redshift.
+
         See: https://ned.ipac.caltech.edu/level5/Hogg/Hogg4.html
         """
-        return (3e5 / h0) * quad(lambda z_prime: 1 / e(z_prime), 0, z)[0]
+        z_prime = 0.5 * z[..., np.newaxis] * (NODES + 1)
+        return (3e5 / h0) * 0.5 * z * (WEIGHTS / e(z_prime)).sum(axis=-1)
 
-    def luminosity_distance() -> float:
+    def luminosity_distance(cmd: float | np.ndarray) -> float | np.ndarray:
         """ Calculate the luminosity distance """
-        return comoving_distance() * (1 + z)
+        return cmd * (1 + z)
+
+    comoving = comoving_distance()
 
-    return Distance(comoving_distance(), luminosity_distance())
+    return Distance(comoving, luminosity_distance(comoving))
 
 
 if __name__ == '__main__':
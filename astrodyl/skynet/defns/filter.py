@@ -7,9 +7,12 @@ class Filter:
         self.efficiency = efficiency
         self.zero_point = zero_point
 
+        self._wavelength_m = 2.998e8 / frequency
+        self._wavelength_um = self._wavelength_m * 1e6
+
     def wavelength(self, micro: bool = False) -> float:
         """ Returns the wavelength of the filter.
 
         :param micro: returns wavelength in units of micro-meters if True
         """
-        return 2.998e8 / self.frequency * (10e5 if micro else 1.0)
+        return self._wavelength_um if micro else self._wavelength_m
@@ -1,5 +1,6 @@
-from typing import List
+import contextlib
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
@@ -11,8 +12,20 @@ from astrodyl.core.astro.transient import Transient
 from astrodyl.models.afterglow import Afterglow as AfterglowModel
 
 
+"""
+    viewer.py
+
+    Interactive viewer for the afterglow exposure model. When run as a
+    script, the QtAgg backend is preferred with TkAgg as the fallback,
+    since their event loops coalesce the viewer's idle draws and support
+    the blitted V mag marker.
+
+    Tool Documentation: https://astrodyl.gitbook.io/astrodyl-docs/campaign-manager/models/visualization
+"""
+
+
 class Viewer:
-    def __init__(self, times: list):
+    def __init__(self, times: np.ndarray):
         # Figure Parameters
         self.ax = None
         self.ax2 = None
@@ -21,10 +34,21 @@ class Viewer:
         self.v_filter_line = None
         self.r_filter_line = None
         self.i_filter_line = None
+        self.initial_ylim = None
 
         # Model Parameters
         self.model = None
-        self.times = times
+        self.times = np.asarray(times, dtype=np.float64)
+        self.minutes = self.times / 60.0
+
+        # Slider range and the initial V mag marker position
+        self.end_minutes = self.times[-1] // 60
+        self.mid_minutes = self.times[-1] // 120
+        self.mid_time = self.times[-1] // 2
+
+        # Exposure curves of every filter keyed by the model parameters
+        self.curves = {}
+        self.max_curves = 32
 
         # Buttons
         self.button_reset = None
@@ -35,6 +59,9 @@ class Viewer:
         self.button_r_mag = None
         self.button_i_mag = None
 
+        # Whether each band's button shows the magnitude or the exposure length
+        self.mag_mode = {'B': True, 'V': True, 'R': True, 'I': True}
+
         # Sliders
         self.slider_temporal = None
         self.slider_spectral = None
@@ -44,6 +71,17 @@ class Viewer:
 
         # Markers
         self.marker_v_mag = None
+        self.background = None
+
+        # Updates are deferred while True, see `batch_update`
+        self.batching = False
+
+        # Slider updates are coalesced to at most one per interval (ms)
+        self.update_timer = None
+        self.update_interval = 33
+
+        # Whether the canvas has an event loop to run the update timer
+        self.interactive = False
 
         # Supported Telescopes and Filters
         self.filters = {
@@ -53,6 +91,9 @@ class Viewer:
             'I': Filter('I', 374741e9, 0.0435316, 2.41600),
         }
 
+        # Row of each filter in the stacked exposure curves
+        self.filter_rows = {name: row for row, name in enumerate(self.filters)}
+
         self.telescopes = {
             'P5': Telescope('P5', 0.237073),
             'MO': Telescope('MO', 0.196503),
@@ -78,19 +119,28 @@ class Viewer:
     def init_figure(self) -> None:
         """ Initializes the figure """
         self.figure, self.ax = plt.subplots(figsize=(15, 10))
-        plt.subplots_adjust(left=0.1, bottom=0.4)
+        self.figure.subplots_adjust(left=0.1, bottom=0.4)
+
+        # Non-interactive backends, such as Agg, have no event loop
+        self.interactive = self.figure.canvas.required_interactive_framework is not None
+
+        self.update_timer = self.figure.canvas.new_timer(interval=self.update_interval)
+        self.update_timer.single_shot = True
+        self.update_timer.add_callback(self.update)
 
         self.init_sliders()
         self.init_buttons()
         self.init_lines()
 
+        self.figure.canvas.mpl_connect('draw_event', self.on_draw)
+
     def init_buttons(self) -> None:
         """ Initializes the buttons """
-        self.button_reset = Button(plt.axes((0.91, 0.8, 0.08, 0.08)), 'Reset',
+        self.button_reset = Button(self.figure.add_axes((0.91, 0.8, 0.08, 0.08)), 'Reset',
                                    color='cornflowerblue', hovercolor='royalblue')
-        self.button_tele_p5 = Button(plt.axes((0.91, 0.7, 0.08, 0.08)), 'PROMPT-5',
+        self.button_tele_p5 = Button(self.figure.add_axes((0.91, 0.7, 0.08, 0.08)), 'PROMPT-5',
                                      color='orchid', hovercolor='mediumvioletred')
-        self.button_tele_mo = Button(plt.axes((0.91, 0.6, 0.08, 0.08)), 'PROMPT-MO',
+        self.button_tele_mo = Button(self.figure.add_axes((0.91, 0.6, 0.08, 0.08)), 'PROMPT-MO',
                                      color='lightcoral', hovercolor='indianred')
 
         self.button_reset.on_clicked(self.on_reset_click)
@@ -98,13 +148,13 @@ class Viewer:
         self.button_tele_mo.on_clicked(self.on_tele_mo_click)
 
         # Display buttons that toggle between magnitude and exposure length
-        self.button_b_mag = Button(plt.axes((0.91, 0.52, 0.08, 0.03)), 'B Mag =',
+        self.button_b_mag = Button(self.figure.add_axes((0.91, 0.52, 0.08, 0.03)), 'B Mag =',
                                    color='white', hovercolor='white')
-        self.button_v_mag = Button(plt.axes((0.91, 0.48, 0.08, 0.03)), 'V Mag =',
+        self.button_v_mag = Button(self.figure.add_axes((0.91, 0.48, 0.08, 0.03)), 'V Mag =',
                                    color='white', hovercolor='white')
-        self.button_r_mag = Button(plt.axes((0.91, 0.44, 0.08, 0.03)), 'R Mag =',
+        self.button_r_mag = Button(self.figure.add_axes((0.91, 0.44, 0.08, 0.03)), 'R Mag =',
                                    color='white', hovercolor='white')
-        self.button_i_mag = Button(plt.axes((0.91, 0.40, 0.08, 0.03)), 'I Mag =',
+        self.button_i_mag = Button(self.figure.add_axes((0.91, 0.40, 0.08, 0.03)), 'I Mag =',
                                    color='white', hovercolor='white')
         self.update_mag_buttons()
 
@@ -115,23 +165,27 @@ class Viewer:
 
     def init_lines(self) -> None:
         """ Initializes the modeled exposure length lines """
-        minutes = [time / 60.0 for time in self.times]
-        self.b_filter_line, = self.ax.plot(minutes, self.get_exposure_lengths('B'), label='B', color='blue')
-        self.v_filter_line, = self.ax.plot(minutes, self.get_exposure_lengths('V'), label='V', color='green')
-        self.r_filter_line, = self.ax.plot(minutes, self.get_exposure_lengths('R'), label='R', color='red')
-        self.i_filter_line, = self.ax.plot(minutes, self.get_exposure_lengths('I'), label='I', color='darkblue')
+        self.b_filter_line, = self.ax.plot(self.minutes, self.get_exposure_lengths('B'), label='B', color='blue')
+        self.v_filter_line, = self.ax.plot(self.minutes, self.get_exposure_lengths('V'), label='V', color='green')
+        self.r_filter_line, = self.ax.plot(self.minutes, self.get_exposure_lengths('R'), label='R', color='red')
+        self.i_filter_line, = self.ax.plot(self.minutes, self.get_exposure_lengths('I'), label='I', color='darkblue')
+
+        # The limits are managed by `update_lines` from here on
+        self.ax.autoscale_view()
+        self.ax.set_autoscale_on(False)
+        self.initial_ylim = self.ax.get_ylim()
 
     def init_sliders(self) -> None:
         """ Initializes the model parameter sliders"""
-        self.slider_v_mag = Slider(plt.axes((0.135, 0.3, 0.73, 0.01)), '', 0., self.times[-1]//60,
-                                   facecolor='skyblue', track_color='steelblue', valinit=self.times[-1] // 120)
-        self.slider_temporal = Slider(plt.axes((0.2, 0.2, 0.7, 0.03)), 'Temporal Index', -3., 3.,
+        self.slider_v_mag = Slider(self.figure.add_axes((0.135, 0.3, 0.73, 0.01)), '', 0., self.end_minutes,
+                                   facecolor='skyblue', track_color='steelblue', valinit=self.mid_minutes)
+        self.slider_temporal = Slider(self.figure.add_axes((0.2, 0.2, 0.7, 0.03)), 'Temporal Index', -3., 3.,
                                       facecolor='skyblue', track_color='steelblue', valinit=-1.0)
-        self.slider_spectral = Slider(plt.axes((0.2, 0.15, 0.7, 0.03)), 'Spectral Index', -3., 3.,
+        self.slider_spectral = Slider(self.figure.add_axes((0.2, 0.15, 0.7, 0.03)), 'Spectral Index', -3., 3.,
                                       facecolor='skyblue', track_color='steelblue', valinit=-0.7)
-        self.slider_ref_time = Slider(plt.axes((0.2, 0.1, 0.7, 0.03)), 'Reference Time', 1., 120.,
+        self.slider_ref_time = Slider(self.figure.add_axes((0.2, 0.1, 0.7, 0.03)), 'Reference Time', 1., 120.,
                                       facecolor='skyblue', track_color='steelblue', valinit=60.)
-        self.slider_ref_mag = Slider(plt.axes((0.2, 0.05, 0.7, 0.03)), 'Reference Mag', 0., 30.,
+        self.slider_ref_mag = Slider(self.figure.add_axes((0.2, 0.05, 0.7, 0.03)), 'Reference Mag', 0., 30.,
                                      facecolor='skyblue', track_color='steelblue', valinit=20.)
 
         # Assign event handlers
@@ -147,10 +201,14 @@ class Viewer:
         the V band line and calculates the magnitude at that point. The
         magnitude is then displayed in separate button.
         """
-        self.model.hardware.filter = self.filters['V']
-        exp_length = self.model.exposure_length(self.times[-1] // 2, self.model.magnitude(self.times[-1] // 2))
+        self.set_filter('V')
+        exp_length = self.model.exposure_length(self.mid_time, self.model.magnitude(self.mid_time))
+
+        self.marker_v_mag, = self.ax.plot(self.mid_minutes, exp_length, marker='o', color='green', markersize=10,
+                                          animated=True)
 
-        self.marker_v_mag, = self.ax.plot(self.times[-1] // 120, exp_length, marker='o', color='green', markersize=10)
+        # The marker and its labels are blitted, see `blit_v_mag`
+        self.slider_v_mag.drawon = False
     # </editor-fold>
 
     def show(self):
@@ -161,11 +219,45 @@ class Viewer:
         self.ax.legend()
         plt.show()
 
+    @contextlib.contextmanager
+    def batch_update(self):
+        """ Defers the updates and redraws triggered inside the block, such
+        as those of several sliders being reset, to a single update once
+        the block exits.
+        """
+        self.batching = True
+        try:
+            yield
+        finally:
+            self.batching = False
+
+        self.update()
+
+    def schedule_update(self) -> None:
+        """ Restarts the update timer so a burst of slider events results in
+        a single update once the slider stops moving.
+        """
+        if self.batching:
+            return
+
+        if not self.interactive:
+            self.update()
+            return
+
+        self.update_timer.stop()
+        self.update_timer.start()
+
     def update(self) -> None:
-        """ """
+        """ Refreshes the model after its parameters were changed in place
+        and redraws the figure.
+        """
+        if self.batching:
+            return
+
+        self.model.precompute()
         self.update_lines()
-        self.update_v_mag_marker(self.slider_v_mag.val * 60.0)
-        self.update_mag_buttons()
+        magnitudes = self.update_mag_buttons()
+        self.update_v_mag_marker(self.slider_v_mag.val * 60.0, magnitudes['V'])
         self.figure.canvas.draw_idle()
 
     # <editor-fold desc="Button Updaters">
@@ -187,25 +279,26 @@ class Viewer:
 
     def toggle_button_label(self, button, time: float, band: str) -> None:
         """ """
-        if 'Mag' in button.label.get_text():
+        if self.mag_mode[band]:
             exp_len = round(self.get_exposure_length(time, band), 2)
             button.label.set_text(f"{band} Len = {exp_len}s")
-
-        elif 'Len' in button.label.get_text():
+        else:
             mag = round(self.get_magnitude(time, band), 2)
             button.label.set_text(f'{band} Mag = {mag}')
 
+        self.mag_mode[band] = not self.mag_mode[band]
         self.figure.canvas.draw_idle()
 
     def on_reset_click(self, event) -> None:
         """ Resets all the sliders and redraws the plot """
-        self.model.hardware.telescope = self.telescopes['P5']
-        self.slider_temporal.reset()
-        self.slider_spectral.reset()
-        self.slider_ref_time.reset()
-        self.slider_ref_mag.reset()
-        self.slider_v_mag.reset()
-        self.update()
+        with self.batch_update():
+            self.model.hardware.telescope = self.telescopes['P5']
+            self.slider_temporal.reset()
+            self.slider_spectral.reset()
+            self.slider_ref_time.reset()
+            self.slider_ref_mag.reset()
+            self.slider_v_mag.reset()
+            self.ax.set_ylim(self.initial_ylim)
 
     def on_tele_p5_click(self, event) -> None:
         """ Updates the model using values for the PROMPT-5 telescope """
@@ -219,27 +312,28 @@ class Viewer:
         self.model.hardware.telescope = self.telescopes['MO']
         self.update()
 
-    def update_button_label(self, button, time: float, band: str) -> None:
-        """ Updates the button label depending on which display is active. """
-        if 'Mag' in button.label.get_text():
-            mag = round(self.get_magnitude(time, band), 2)
-            button.label.set_text(f'{band} Mag = {mag}')
-        elif 'Len' in button.label.get_text():
-            exp_len = round(self.get_exposure_length(time, band), 2)
-            button.label.set_text(f'{band} Len = {exp_len}s')
+    def update_mag_buttons(self) -> dict:
+        """ Updates the magnitude buttons according to whether they are
+        toggled to the magnitude or the exposure length. All four bands are
+        modeled in one batch.
 
-    def update_mag_buttons(self) -> None:
-        """ Updates the magnitude buttons. Checks if they are toggled
-        between magnitude and exposure length.
+        :return: dictionary of the modeled magnitudes keyed by filter name
         """
-        if 'B' in self.button_b_mag.label.get_text():
-            self.update_button_label(self.button_b_mag, self.slider_v_mag.val * 60.0, 'B')
-        if 'R' in self.button_r_mag.label.get_text():
-            self.update_button_label(self.button_r_mag, self.slider_v_mag.val * 60.0, 'R')
-        if 'I' in self.button_i_mag.label.get_text():
-            self.update_button_label(self.button_i_mag, self.slider_v_mag.val * 60.0, 'I')
-        if 'V' in self.button_v_mag.label.get_text():
-            self.update_button_label(self.button_v_mag, self.slider_v_mag.val * 60.0, 'V')
+        time = self.slider_v_mag.val * 60.0
+        magnitudes = self.model.magnitude_all(time, self.filters.values())
+
+        lengths = None
+        if not all(self.mag_mode.values()):
+            lengths = self.model.exposure_length_all(time, self.filters.values(), magnitudes)
+
+        for band, button in (('B', self.button_b_mag), ('V', self.button_v_mag),
+                             ('R', self.button_r_mag), ('I', self.button_i_mag)):
+            if self.mag_mode[band]:
+                button.label.set_text(f'{band} Mag = {round(magnitudes[band], 2)}')
+            else:
+                button.label.set_text(f'{band} Len = {round(lengths[band], 2)}s')
+
+        return magnitudes
     # </editor-fold">
 
     # <editor-fold desc="Slider Updaters">
@@ -249,63 +343,133 @@ class Viewer:
             return
 
         self.marker_v_mag.set_xdata([val])
-        self.update_v_mag_marker(val * 60.0)
-        self.update_mag_buttons()
+
+        # The batched update refreshes the buttons once the block exits
+        if self.batching:
+            return
+
+        magnitudes = self.update_mag_buttons()
+        self.update_v_mag_marker(val * 60.0, magnitudes['V'])
+        self.blit_v_mag()
 
     def on_temporal_update(self, val: float) -> None:
         """ Updates the plot after a change to the temporal index slider """
         self.model.transient.temporal_index = self.slider_temporal.val
-        self.update()
+        self.schedule_update()
 
     def on_spectral_update(self, val: float) -> None:
         """ Updates the plot after a change to the spectral index slider """
         self.model.transient.spectral_index = self.slider_spectral.val
-        self.update()
+        self.schedule_update()
 
     def on_reference_magnitude_update(self, val: float) -> None:
         """ Updates the plot after a change to the reference magnitude slider """
         self.model.reference_parameters.magnitude = self.slider_ref_mag.val
-        self.update()
+        self.schedule_update()
 
     def on_reference_time_update(self, val: float) -> None:
         """ Updates the plot after a change to the reference time slider """
         self.model.reference_parameters.time = self.slider_ref_time.val * 60.0
-        self.update()
+        self.schedule_update()
     # </editor-fold>
 
     # <editor-fold desc="Other Updaters">
-    def update_v_mag_marker(self, time: float) -> None:
+    def on_draw(self, event) -> None:
+        """ Captures the freshly drawn plot without the animated V mag
+        marker, then draws the marker on top of it.
+        """
+        self.background = self.figure.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.marker_v_mag)
+
+    def blit_v_mag(self) -> None:
+        """ Repaints only the V mag marker, its slider, and the magnitude
+        buttons instead of redrawing the whole figure.
+        """
+        if self.batching:
+            return
+
+        canvas = self.figure.canvas
+
+        if self.background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+
+        canvas.restore_region(self.background)
+        self.ax.draw_artist(self.marker_v_mag)
+        canvas.blit(self.ax.bbox)
+
+        for button in (self.slider_v_mag, self.button_b_mag, self.button_v_mag, self.button_r_mag, self.button_i_mag):
+            self.figure.draw_artist(button.ax)
+            canvas.blit(button.ax.bbox)
+
+    def update_v_mag_marker(self, time: float, mag: float = None) -> None:
         """ Moves the V band marker according to the model parameters.
 
         :param time: time in seconds since the trigger
+        :param mag: V band magnitude at the time if already known
         """
-        self.model.hardware.filter = self.filters['V']
-        self.marker_v_mag.set_ydata([self.model.exposure_length(time, self.model.magnitude(time))])
+        self.set_filter('V')
+        self.marker_v_mag.set_ydata([self.model.exposure_length(time, mag)])
 
     def update_lines(self) -> None:
         """ Recalculates the exposure lengths and updates the plotted lines
         accordingly.
         """
-        original_filter = self.model.hardware.filter
-
         self.b_filter_line.set_ydata(self.get_exposure_lengths('B'))
         self.v_filter_line.set_ydata(self.get_exposure_lengths('V'))
         self.r_filter_line.set_ydata(self.get_exposure_lengths('R'))
         self.i_filter_line.set_ydata(self.get_exposure_lengths('I'))
 
-        self.model.hardware.filter = original_filter
+        # Only extend the view when the curves grow well past its top
+        bottom, top = self.ax.get_ylim()
+        peak = max(line.get_ydata().max() for line in
+                   (self.b_filter_line, self.v_filter_line, self.r_filter_line, self.i_filter_line))
+
+        if peak > top * 1.2:
+            self.ax.set_ylim(bottom, peak)
+
+    def set_filter(self, filter_: str) -> None:
+        """ Swaps the model's filter, skipping the swap when the filter is
+        already in use.
+
+        :param filter_: filter name
+        """
+        if self.model.filter is not self.filters[filter_]:
+            self.model.filter = self.filters[filter_]
     # </editor-fold>
 
     # <editor-fold desc="Getters">
-    def get_exposure_lengths(self, filter_: str) -> List[float]:
+    def get_exposure_lengths(self, filter_: str) -> np.ndarray:
         """ Returns the modeled exposure lengths in the provided filter
         band.
 
         :param filter_: filter name
-        :return: list modeled exposure lengths
+        :return: array of modeled exposure lengths
+        """
+        key = self.get_model_key()
+
+        curves = self.curves.pop(key, None)
+        if curves is None:
+            curves = self.model.exposure_length_grid(self.times, self.filters.values())
+
+            # Evict the least recently used curves once the cache is full
+            if len(self.curves) >= self.max_curves:
+                del self.curves[next(iter(self.curves))]
+
+        # Reinserting keeps the most recently used curves at the end
+        self.curves[key] = curves
+
+        return curves[self.filter_rows[filter_]]
+
+    def get_model_key(self) -> tuple:
+        """ Returns the model parameters that the viewer can change and
+        that the exposure curves depend on.
+
+        :return: tuple of the model parameters
         """
-        self.model.hardware.filter = self.filters[filter_]
-        return [self.model.exposure_length(time) for time in self.times]
+        return (self.model.transient.temporal_index, self.model.transient.spectral_index,
+                self.model.reference_parameters.time, self.model.reference_parameters.magnitude,
+                self.model.hardware.telescope.name)
 
     def get_exposure_length(self, time: float, filter_: str, mag: float = None) -> float:
         """ Returns the exposure length at the provided time in the provided
@@ -316,7 +480,7 @@ class Viewer:
         :param mag: magnitude of the of target
         :return: modeled exposure length in seconds
         """
-        self.model.hardware.filter = self.filters[filter_]
+        self.set_filter(filter_)
         return self.model.exposure_length(time, mag)
 
     def get_magnitude(self, time: float, filter_: str) -> float:
@@ -327,12 +491,19 @@ class Viewer:
         :param filter_: filter name
         :return: modeled magnitude
         """
-        self.model.hardware.filter = self.filters[filter_]
+        self.set_filter(filter_)
         return self.model.magnitude(time)
     # </editor-fold>
 
 
 if __name__ == '__main__':
-    viewer = Viewer(times=[float(i) for i in range(1, 7201, 2)])
+    for backend in ('QtAgg', 'TkAgg'):
+        try:
+            plt.switch_backend(backend)
+            break
+        except ImportError:
+            continue
+
+    viewer = Viewer(times=np.arange(1.0, 7201.0, 2.0))
 
     viewer.show()